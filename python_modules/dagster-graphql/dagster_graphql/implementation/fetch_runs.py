@@ -1,40 +1,49 @@
-from collections import defaultdict
-from typing import Dict, List, Mapping, cast
+import threading
+from collections import OrderedDict, defaultdict
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional, cast
+from weakref import WeakKeyDictionary
 
 from graphql.execution.base import ResolveInfo
 
-from dagster import AssetKey, PipelineDefinition, PipelineRunStatus
+from dagster import AssetKey, DagsterInstance, PipelineDefinition, PipelineRunStatus
 from dagster import _check as check
 from dagster.config.validate import validate_config
 from dagster.core.definitions import create_run_config_schema
 from dagster.core.errors import DagsterRunNotFoundError
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster.core.host_representation import PipelineSelector
-from dagster.core.storage.pipeline_run import PipelineRun, RunRecord, RunsFilter
+from dagster.core.storage.event_log.base import AssetRecord
+from dagster.core.storage.pipeline_run import (
+    PipelineRun,
+    PipelineRunStatsSnapshot,
+    RunRecord,
+    RunsFilter,
+)
 from dagster.core.storage.tags import TagType, get_tag_type
 
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import get_run_record_loader
 from .utils import UserFacingGraphQLError, capture_error
 
 
-def is_config_valid(pipeline_def, run_config, mode):
+def _validate_run_config(pipeline_def, run_config, mode):
     check.str_param(mode, "mode")
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
 
+    # the run config schema is memoized per mode on the pipeline definition, so repeated
+    # validations against the same pipeline do not rebuild it
     run_config_schema = create_run_config_schema(pipeline_def, mode)
-    validated_config = validate_config(run_config_schema.config_type, run_config)
-    return validated_config.success
+    return validate_config(run_config_schema.config_type, run_config)
 
 
-def get_validated_config(pipeline_def, run_config, mode):
-    from ..schema.pipelines.config import GrapheneRunConfigValidationInvalid
+def is_config_valid(pipeline_def, run_config, mode):
+    return _validate_run_config(pipeline_def, run_config, mode).success
 
-    check.str_param(mode, "mode")
-    check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
 
-    run_config_schema = create_run_config_schema(pipeline_def, mode)
+def get_validated_config(pipeline_def, run_config, mode):
+    from ..schema.pipelines.config import GrapheneRunConfigValidationInvalid
 
-    validated_config = validate_config(run_config_schema.config_type, run_config)
+    validated_config = _validate_run_config(pipeline_def, run_config, mode)
 
     if not validated_config.success:
         raise UserFacingGraphQLError(
@@ -50,12 +59,11 @@ def get_run_by_id(graphene_info, run_id):
     from ..schema.errors import GrapheneRunNotFoundError
     from ..schema.pipelines.pipeline import GrapheneRun
 
-    instance = graphene_info.context.instance
-    records = instance.get_run_records(RunsFilter(run_ids=[run_id]))
-    if not records:
+    record = get_run_record_loader(graphene_info).load(run_id)
+    if not record:
         return GrapheneRunNotFoundError(run_id)
     else:
-        return GrapheneRun(records[0])
+        return GrapheneRun(record)
 
 
 def get_run_tags(graphene_info):
@@ -77,18 +85,14 @@ def get_run_group(graphene_info, run_id):
 
     instance = graphene_info.context.instance
     try:
-        result = instance.get_run_group(run_id)
+        result = instance.get_run_group_records(run_id)
     except DagsterRunNotFoundError:
         return GrapheneRunGroupNotFoundError(run_id)
-    root_run_id, run_group = result
-    run_group_run_ids = [run.run_id for run in run_group]
-    records_by_id = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(RunsFilter(run_ids=run_group_run_ids))
-    }
+    root_run_id, run_group_records = result
+    get_run_record_loader(graphene_info).prime(run_group_records)
     return GrapheneRunGroup(
         root_run_id=root_run_id,
-        runs=[GrapheneRun(records_by_id.get(run_id)) for run_id in run_group_run_ids],
+        runs=[GrapheneRun(record) for record in run_group_records],
     )
 
 
@@ -101,24 +105,30 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
 
     instance = graphene_info.context.instance
 
-    return [
+    # the graphql executor iterates the results exactly once, so wrap the records lazily rather
+    # than holding a second full list of GrapheneRun objects alongside the records
+    return (
         GrapheneRun(record)
         for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    )
 
 
-PENDING_STATUSES = [
-    PipelineRunStatus.STARTING,
-    PipelineRunStatus.MANAGED,
-    PipelineRunStatus.NOT_STARTED,
-    PipelineRunStatus.QUEUED,
-    PipelineRunStatus.STARTED,
-    PipelineRunStatus.CANCELING,
-]
-IN_PROGRESS_STATUSES = [
-    PipelineRunStatus.STARTED,
-    PipelineRunStatus.CANCELING,
-]
+PENDING_STATUSES = frozenset(
+    [
+        PipelineRunStatus.STARTING,
+        PipelineRunStatus.MANAGED,
+        PipelineRunStatus.NOT_STARTED,
+        PipelineRunStatus.QUEUED,
+        PipelineRunStatus.STARTED,
+        PipelineRunStatus.CANCELING,
+    ]
+)
+IN_PROGRESS_STATUSES = frozenset(
+    [
+        PipelineRunStatus.STARTED,
+        PipelineRunStatus.CANCELING,
+    ]
+)
 
 
 def get_assets_live_info(graphene_info, step_keys_by_asset: Mapping[AssetKey, List[str]]):
@@ -130,25 +140,23 @@ def get_assets_live_info(graphene_info, step_keys_by_asset: Mapping[AssetKey, Li
     # Get latest run ID for all selected assets
     asset_records = instance.get_asset_records(step_keys_by_asset.keys())
 
+    # assets without a materialization are left out, and resolve to None through .get() below
     latest_materialization_by_asset = {
         asset_record.asset_entry.asset_key: GrapheneMaterializationEvent(
             event=asset_record.asset_entry.last_materialization
         )
-        if asset_record.asset_entry.last_materialization
-        else None
         for asset_record in asset_records
+        if asset_record.asset_entry.last_materialization
     }
 
-    latest_run_ids = [  # last_run_id column is written to upon run creation (via ASSET_MATERIALIZATION_PLANNED event)
-        asset_record.asset_entry.last_run_id
-        for asset_record in asset_records
-        if asset_record.asset_entry.last_run_id
-    ]
-    in_progress_records = (
-        instance.get_run_records(RunsFilter(run_ids=latest_run_ids, statuses=PENDING_STATUSES))
-        if latest_run_ids
-        else []
-    )
+    # a single run may be the latest run for many of the selected assets
+    in_progress_records_by_run_id = {
+        run_record.pipeline_run.run_id: run_record
+        for run_record in _get_latest_run_records_by_asset_key(
+            graphene_info, asset_records, statuses=PENDING_STATUSES
+        ).values()
+    }
+    in_progress_records = list(in_progress_records_by_run_id.values())
     in_progress_run_ids_by_asset, unstarted_run_ids_by_asset = _get_in_progress_runs_for_assets(
         graphene_info, in_progress_records, step_keys_by_asset
     )
@@ -175,28 +183,61 @@ def _get_in_progress_runs_for_assets(
         for step_key in step_keys:
             asset_key_by_step_key[step_key].add(asset_key)
 
+    # The step keys of a run are needed to infer its selected assets and to fetch its step stats.
+    # Runs with an explicit asset selection that have not begun execution need neither.
+    records_needing_step_keys = [
+        record
+        for record in in_progress_records
+        if record.pipeline_run.asset_selection is None
+        or record.pipeline_run.status in IN_PROGRESS_STATUSES
+    ]
+
+    # Fetch the execution plan snapshots for all runs in a single query
+    execution_plan_snapshots_by_id = graphene_info.context.instance.get_execution_plan_snapshots(
+        list(
+            {record.pipeline_run.execution_plan_snapshot_id for record in records_needing_step_keys}
+        )
+    )
+
+    run_step_keys_by_run_id = {
+        record.pipeline_run.run_id: execution_plan_snapshots_by_id[
+            record.pipeline_run.execution_plan_snapshot_id
+        ].step_keys_to_execute
+        for record in records_needing_step_keys
+    }
+
+    # Fetch the step stats for all runs that have begun execution in a single query
+    step_stats_by_run_id = graphene_info.context.instance.get_batch_run_step_stats(
+        {
+            record.pipeline_run.run_id: run_step_keys_by_run_id[record.pipeline_run.run_id]
+            for record in records_needing_step_keys
+            if record.pipeline_run.status in IN_PROGRESS_STATUSES
+        }
+    )
+
     in_progress_run_ids_by_asset = defaultdict(set)
     unstarted_run_ids_by_asset = defaultdict(set)
+    step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
 
     for record in in_progress_records:
         run = record.pipeline_run
         asset_selection = run.asset_selection
-        run_step_keys = graphene_info.context.instance.get_execution_plan_snapshot(
-            run.execution_plan_snapshot_id
-        ).step_keys_to_execute
 
         selected_assets = (
-            set.union(*[asset_key_by_step_key[run_step_key] for run_step_key in run_step_keys])
+            set().union(
+                *(
+                    asset_key_by_step_key[run_step_key]
+                    for run_step_key in run_step_keys_by_run_id[run.run_id]
+                )
+            )
             if asset_selection == None
             else cast(frozenset, asset_selection)
         )  # only display in progress/unstarted indicators for selected assets
 
         if run.status in IN_PROGRESS_STATUSES:
-            step_stats = graphene_info.context.instance.get_run_step_stats(
-                run.run_id, run_step_keys
-            )
+            step_stats = step_stats_by_run_id[run.run_id]
             # Build mapping of asset to all the step stats that generate the asset
-            step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
+            step_stats_by_asset.clear()
             for step_stat in step_stats:
                 for asset_key in asset_key_by_step_key[step_stat.step_key]:
                     step_stats_by_asset[asset_key].append(step_stat)
@@ -206,10 +247,7 @@ def _get_in_progress_runs_for_assets(
                 if step_stats:
                     # step_stats will contain all steps that are in progress or complete
                     if any(
-                        [
-                            step_stat.status == StepEventStatus.IN_PROGRESS
-                            for step_stat in step_stats
-                        ]
+                        step_stat.status == StepEventStatus.IN_PROGRESS for step_stat in step_stats
                     ):
                         in_progress_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
                     # else if step_stats exist and none are in progress, the step has completed
@@ -228,33 +266,53 @@ def get_latest_asset_run_by_step_key(graphene_info, asset_nodes):
 
     instance = graphene_info.context.instance
 
-    latest_run_by_step: Dict[str, PipelineRun] = {}
-    latest_run_id_by_asset: Dict[AssetKey, str] = {}
-
-    for record in instance.get_asset_records([asset.asset_key for asset in asset_nodes]):
-        asset_key = record.asset_entry.asset_key
-        last_run_id = record.asset_entry.last_run_id
-        if last_run_id:
-            latest_run_id_by_asset[asset_key] = last_run_id
-
-    run_records_by_run_id = {}
-    run_ids = list(set(latest_run_id_by_asset.values()))
-    if run_ids:
-        run_records = instance.get_run_records(RunsFilter(run_ids=run_ids))
-        for run_record in run_records:
-            run_records_by_run_id[run_record.pipeline_run.run_id] = run_record
+    asset_records = instance.get_asset_records([asset.asset_key for asset in asset_nodes])
+    run_records_by_asset_key = _get_latest_run_records_by_asset_key(graphene_info, asset_records)
 
+    latest_run_by_step: Dict[str, PipelineRun] = {}
     for asset in asset_nodes:
-        run_id = latest_run_id_by_asset.get(asset.asset_key)
+        run_record = run_records_by_asset_key.get(asset.asset_key)
         step_key = asset.op_name
         # return run = None when no runs have occurred for the asset
         latest_run_by_step[step_key] = GrapheneLatestRun(
-            step_key, GrapheneRun(run_records_by_run_id[run_id]) if run_id else None
+            step_key, GrapheneRun(run_record) if run_record else None
         )
 
     return [latest_run_by_step.get(asset_node.op_name) for asset_node in asset_nodes]
 
 
+def _get_latest_run_records_by_asset_key(
+    graphene_info,
+    asset_records: Iterable[AssetRecord],
+    statuses: Optional[AbstractSet[PipelineRunStatus]] = None,
+) -> Dict[AssetKey, RunRecord]:
+    # Asset records and run records live in separate storages, so they cannot be joined in a single
+    # query.  Instead, fetch the run records for the last run of every asset in one batch.
+    # last_run_id column is written to upon run creation (via ASSET_MATERIALIZATION_PLANNED event)
+    latest_run_id_by_asset: Dict[AssetKey, str] = {
+        asset_record.asset_entry.asset_key: asset_record.asset_entry.last_run_id
+        for asset_record in asset_records
+        if asset_record.asset_entry.last_run_id
+    }
+
+    if not latest_run_id_by_asset:
+        return {}
+
+    # statuses are filtered in memory so that the fetched run records can be shared with other
+    # resolvers in the same request through the run record loader
+    loaded = get_run_record_loader(graphene_info).load_many(latest_run_id_by_asset.values())
+    run_records_by_run_id = {
+        run_id: run_record
+        for run_id, run_record in loaded.items()
+        if statuses is None or run_record.pipeline_run.status in statuses
+    }
+    return {
+        asset_key: run_records_by_run_id[run_id]
+        for asset_key, run_id in latest_run_id_by_asset.items()
+        if run_id in run_records_by_run_id
+    }
+
+
 def get_runs_count(graphene_info, filters):
     return graphene_info.context.instance.get_runs_count(filters)
 
@@ -270,18 +328,13 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     instance = graphene_info.context.instance
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
     run_ids = {run.run_id for run_group in run_groups.values() for run in run_group.get("runs", [])}
-    records_by_ids = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(RunsFilter(run_ids=list(run_ids)))
-    }
-
-    for root_run_id in run_groups:
-        run_groups[root_run_id]["runs"] = [
-            GrapheneRun(records_by_ids.get(run.run_id)) for run in run_groups[root_run_id]["runs"]
-        ]
+    records_by_ids = get_run_record_loader(graphene_info).load_many(run_ids)
 
     return [
-        GrapheneRunGroup(root_run_id=root_run_id, runs=run_group["runs"])
+        GrapheneRunGroup(
+            root_run_id=root_run_id,
+            runs=[GrapheneRun(records_by_ids.get(run.run_id)) for run in run_group["runs"]],
+        )
         for root_run_id, run_group in run_groups.items()
     ]
 
@@ -320,12 +373,42 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
     )
 
 
+# Stats for runs that have finished are immutable, so they are kept in a bounded LRU cache to serve
+# repeated polling without re-reading the event log.  The cache is scoped to the instance, and keyed
+# by run id and run creation time so that a run that is deleted and re-created under the same id is
+# not served the stats of the old run.
+FINISHED_RUN_STATS_CACHE_SIZE = 1024
+_finished_run_stats_caches: "WeakKeyDictionary[DagsterInstance, OrderedDict]" = WeakKeyDictionary()
+_finished_run_stats_cache_lock = threading.Lock()
+
+
+def _get_run_stats(instance: DagsterInstance, run_record: RunRecord) -> PipelineRunStatsSnapshot:
+    run_id = run_record.pipeline_run.run_id
+    cache_key = (run_id, run_record.create_timestamp)
+    with _finished_run_stats_cache_lock:
+        cache = _finished_run_stats_caches.setdefault(instance, OrderedDict())
+        if cache_key in cache:
+            cache.move_to_end(cache_key)
+            return cache[cache_key]
+
+    stats = instance.get_run_stats(run_id)
+    if stats.end_time is None:
+        # the run is still in progress, so its stats may change
+        return stats
+
+    with _finished_run_stats_cache_lock:
+        cache[cache_key] = stats
+        if len(cache) > FINISHED_RUN_STATS_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return stats
+
+
 @capture_error
-def get_stats(graphene_info, run_id):
+def get_stats(graphene_info, run_record: RunRecord):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
-    stats.id = "stats-{run_id}"
+    stats = _get_run_stats(graphene_info.context.instance, run_record)
     return GrapheneRunStatsSnapshot(stats)
 
 
@@ -1,7 +1,11 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from graphql.execution.base import ResolveInfo
 
 from dagster import DagsterInstance
 from dagster import _check as check
@@ -269,6 +273,97 @@ def _fetch(self):
             self._records[record.pipeline_run.run_id] = record
 
 
+RUN_RECORDS_CHUNK_SIZE = 500
+MAX_RUN_RECORDS_FETCH_WORKERS = 4
+
+
+class RunRecordLoader:
+    """
+    A loader that fetches run records by run_id on demand.  Unlike the BatchRunLoader, the set of
+    run ids does not need to be known up front: each call to `load_many` fetches all of the
+    requested run ids that have not been loaded yet in a single batch, and caches the results.
+
+    This loader is expected to be shared across resolvers for the duration of a single graphql
+    query (see `get_run_record_loader`), so that resolvers which each look up runs by id do not
+    issue separate DB requests for the same runs.
+    """
+
+    def __init__(self, instance: DagsterInstance):
+        self._instance = instance
+        self._records: Dict[str, Optional[RunRecord]] = {}
+
+    def load(self, run_id: str) -> Optional[RunRecord]:
+        check.str_param(run_id, "run_id")
+        return self.load_many([run_id]).get(run_id)
+
+    def load_many(self, run_ids: Iterable[str]) -> Dict[str, RunRecord]:
+        run_ids = list(dict.fromkeys(run_ids))
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in self._records]
+        if missing_run_ids:
+            fetched = self._fetch(missing_run_ids)
+            for run_id in missing_run_ids:
+                self._records[run_id] = fetched.get(run_id)
+
+        return {
+            run_id: self._records[run_id] for run_id in run_ids if self._records[run_id] is not None
+        }
+
+    def prime(self, records: Iterable[RunRecord]):
+        for record in records:
+            self._records[record.pipeline_run.run_id] = record
+
+    def _fetch(self, run_ids: List[str]) -> Dict[str, RunRecord]:
+        # fetch large id sets in fixed-size chunks so that no single query carries an unbounded
+        # IN clause, issuing the chunk queries concurrently to overlap database round trips
+        chunks = [
+            run_ids[i : i + RUN_RECORDS_CHUNK_SIZE]
+            for i in range(0, len(run_ids), RUN_RECORDS_CHUNK_SIZE)
+        ]
+
+        def _fetch_chunk(chunk):
+            return self._instance.get_run_records(RunsFilter(run_ids=chunk))
+
+        if len(chunks) == 1:
+            chunk_records = [_fetch_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(chunks), MAX_RUN_RECORDS_FETCH_WORKERS)
+            ) as executor:
+                chunk_records = list(executor.map(_fetch_chunk, chunks))
+
+        return {
+            record.pipeline_run.run_id: record for records in chunk_records for record in records
+        }
+
+
+# run record loaders registered against each request context, along with the graphql operation
+# they were created for
+_run_record_loaders: "WeakKeyDictionary[Any, Tuple[Any, RunRecordLoader]]" = WeakKeyDictionary()
+
+
+def get_run_record_loader(graphene_info: ResolveInfo) -> RunRecordLoader:
+    """
+    Returns the run record loader for the graphql operation currently being executed.
+
+    The loader is cached only for queries.  Subscriptions are long-lived and mutations change run
+    state between fields, so each of those resolutions gets a fresh loader instead.
+    """
+    check.inst_param(graphene_info, "graphene_info", ResolveInfo)
+    context = graphene_info.context
+    operation = graphene_info.operation
+
+    if operation is None or operation.operation != "query":
+        return RunRecordLoader(context.instance)
+
+    entry = _run_record_loaders.get(context)
+    if entry is None or entry[0] is not operation:
+        # request contexts may be reused across operations, so a loader from a previous operation
+        # on the same context is discarded rather than serving stale run records
+        entry = (operation, RunRecordLoader(context.instance))
+        _run_record_loaders[context] = entry
+    return entry[1]
+
+
 class BatchMaterializationLoader:
     """
     A batch loader that fetches materializations for asset keys.  This loader is expected to be
@@ -303,7 +303,7 @@ def resolve_pipelineSnapshotId(self, _graphene_info):
         return self._pipeline_run.pipeline_snapshot_id
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self._run_record)
 
     def resolve_stepStats(self, graphene_info):
         return get_step_stats(graphene_info, self.run_id)
@@ -1,6 +1,7 @@
 import copy
 
 import yaml
+from dagster_graphql.implementation import loader
 from dagster_graphql.test.utils import (
     define_out_of_process_context,
     execute_dagster_graphql,
@@ -25,7 +26,8 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
-from dagster.core.test_utils import instance_for_test
+from dagster.core.test_utils import create_run_for_test, instance_for_test
+from dagster.core.utils import make_new_run_id
 from dagster.utils import Counter, traced_counter
 
 RUNS_QUERY = """
@@ -224,6 +226,36 @@
 }
 """
 
+REPEATED_RUN_QUERY = """
+query RepeatedRunQuery($runId: ID!) {
+    first: runOrError(runId: $runId) {
+        ... on Run {
+            runId
+        }
+    }
+    second: runOrError(runId: $runId) {
+        ... on Run {
+            runId
+        }
+    }
+}
+"""
+
+RUN_STATS_QUERY = """
+query RunStatsQuery($runId: ID!) {
+    runOrError(runId: $runId) {
+        ... on Run {
+            runId
+            stats {
+                ... on RunStatsSnapshot {
+                    endTime
+                }
+            }
+        }
+    }
+}
+"""
+
 
 def _get_runs_data(result, run_id):
     for run_data in result.data["pipelineOrError"]["runs"]:
@@ -912,3 +944,82 @@ def test_asset_batching():
             counts = counter.counts()
             assert counts
             assert counts.get("DagsterInstance.get_run_records") == 1
+
+
+def test_run_record_loader_batching():
+    with instance_for_test() as instance:
+        repo = get_repo_at_time_1()
+        run_id = execute_pipeline(repo.get_pipeline("foo_pipeline"), instance=instance).run_id
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(
+                context, REPEATED_RUN_QUERY, variables={"runId": run_id}
+            )
+            assert result.data["first"]["runId"] == run_id
+            assert result.data["second"]["runId"] == run_id
+            counts = traced_counter.get().counts()
+            # both fields are resolved from a single run record fetch
+            assert counts.get("DagsterInstance.get_run_records") == 1
+
+            # the loader is scoped to a single operation, so a new query fetches the run again
+            execute_dagster_graphql(context, REPEATED_RUN_QUERY, variables={"runId": run_id})
+            counts = traced_counter.get().counts()
+            assert counts.get("DagsterInstance.get_run_records") == 2
+
+
+def test_finished_run_stats_cache():
+    with instance_for_test() as instance:
+        repo = get_repo_at_time_1()
+        finished_run_id = execute_pipeline(
+            repo.get_pipeline("foo_pipeline"), instance=instance
+        ).run_id
+        in_progress_run_id = create_run_for_test(
+            instance, pipeline_name="foo_pipeline", status=PipelineRunStatus.STARTED
+        ).run_id
+
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            traced_counter.set(Counter())
+            for _ in range(2):
+                result = execute_dagster_graphql(
+                    context, RUN_STATS_QUERY, variables={"runId": finished_run_id}
+                )
+                assert result.data["runOrError"]["stats"]["endTime"]
+            # stats for a finished run are read once and then served from the cache
+            assert traced_counter.get().counts().get("DagsterInstance.get_run_stats") == 1
+
+            traced_counter.set(Counter())
+            for _ in range(2):
+                result = execute_dagster_graphql(
+                    context, RUN_STATS_QUERY, variables={"runId": in_progress_run_id}
+                )
+                assert result.data["runOrError"]["stats"]["endTime"] is None
+            # stats for a run that has not finished are always read fresh
+            assert traced_counter.get().counts().get("DagsterInstance.get_run_stats") == 2
+
+
+def test_run_record_loader_chunking(monkeypatch):
+    with instance_for_test() as instance:
+        run_ids = [create_run_for_test(instance).run_id for _ in range(5)]
+
+        # count calls directly, since chunks are fetched on worker threads
+        fetched_chunks = []
+        get_run_records = instance.get_run_records
+
+        def _get_run_records(filters):
+            fetched_chunks.append(filters.run_ids)
+            return get_run_records(filters)
+
+        monkeypatch.setattr(instance, "get_run_records", _get_run_records)
+
+        records = loader.RunRecordLoader(instance).load_many(run_ids)
+        assert set(records.keys()) == set(run_ids)
+        # ids that fit in a single chunk are fetched in one call
+        assert len(fetched_chunks) == 1
+
+        monkeypatch.setattr(loader, "RUN_RECORDS_CHUNK_SIZE", 2)
+        fetched_chunks.clear()
+        records = loader.RunRecordLoader(instance).load_many(run_ids + [make_new_run_id()])
+        # records from every chunk are merged, and unknown ids are left out
+        assert len(fetched_chunks) == 3
+        assert set(records.keys()) == set(run_ids)
+        assert all(records[run_id].pipeline_run.run_id == run_id for run_id in run_ids)
@@ -748,6 +748,12 @@ def has_historical_pipeline(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_execution_plan_snapshots(
+        self, snapshot_ids: Sequence[str]
+    ) -> Dict[str, "ExecutionPlanSnapshot"]:
+        return self._run_storage.get_execution_plan_snapshots(snapshot_ids)
+
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
@@ -756,6 +762,12 @@ def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_batch_run_step_stats(
+        self, step_keys_by_run_id: Mapping[str, Optional[List[str]]]
+    ) -> Dict[str, List["RunStepKeyStatsSnapshot"]]:
+        return self._event_storage.get_step_stats_for_runs(step_keys_by_run_id)
+
     @traced
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
@@ -764,6 +776,10 @@ def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun]]]:
         return self._run_storage.get_run_group(run_id)
 
+    @traced
+    def get_run_group_records(self, run_id: str) -> Optional[Tuple[str, List[RunRecord]]]:
+        return self._run_storage.get_run_group_records(run_id)
+
     def create_run_for_pipeline(
         self,
         pipeline_def,
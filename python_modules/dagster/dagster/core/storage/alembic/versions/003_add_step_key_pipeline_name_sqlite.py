@@ -21,18 +21,20 @@
 def upgrade():
     bind = op.get_context().bind
     inspector = reflection.Inspector.from_engine(bind)
-    has_tables = inspector.get_table_names()
+    has_tables = set(inspector.get_table_names())
     if "event_logs" in has_tables:
-        columns = [x.get("name") for x in inspector.get_columns("event_logs")]
+        columns = {x.get("name") for x in inspector.get_columns("event_logs")}
         if "step_key" not in columns:
-            op.add_column("event_logs", sa.Column("step_key", sa.String))
+            with op.batch_alter_table("event_logs") as batch_op:
+                batch_op.add_column(sa.Column("step_key", sa.String))
 
 
 def downgrade():
     bind = op.get_context().bind
     inspector = reflection.Inspector.from_engine(bind)
-    has_tables = inspector.get_table_names()
+    has_tables = set(inspector.get_table_names())
     if "event_logs" in has_tables:
-        columns = [x.get("name") for x in inspector.get_columns("event_logs")]
+        columns = {x.get("name") for x in inspector.get_columns("event_logs")}
         if "step_key" in columns:
-            op.drop_column("event_logs", "step_key")
+            with op.batch_alter_table("event_logs") as batch_op:
+                batch_op.drop_column("step_key")
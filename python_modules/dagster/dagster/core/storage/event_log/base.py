@@ -5,6 +5,7 @@
 from enum import Enum
 from typing import (
     Callable,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -275,6 +276,18 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_step_stats_for_runs(
+        self, step_keys_by_run_id: Mapping[str, Optional[List[str]]]
+    ) -> Dict[str, List[RunStepKeyStatsSnapshot]]:
+        """Get per-step stats for a batch of pipeline runs, keyed by run id.
+
+        Storages that can fetch the events for many runs in a single query should override this.
+        """
+        return {
+            run_id: self.get_step_stats_for_run(run_id, step_keys)
+            for run_id, step_keys in step_keys_by_run_id.items()
+        }
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -1,7 +1,7 @@
 import logging
 import warnings
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, cast
 
@@ -15,7 +15,10 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
+from dagster.core.execution.stats import (
+    RunStepKeyStatsSnapshot,
+    build_run_step_stats_from_events,
+)
 from dagster.serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
@@ -394,27 +397,8 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                        DagsterEventType.ENGINE_EVENT.value,
-                    ]
-                )
-            )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+        raw_event_query = self._step_stats_events_query([SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
         )
         if step_keys:
             raw_event_query = raw_event_query.where(
@@ -435,6 +419,74 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def get_step_stats_for_runs(
+        self, step_keys_by_run_id: Mapping[str, Optional[List[str]]]
+    ) -> Dict[str, List[RunStepKeyStatsSnapshot]]:
+        check.mapping_param(step_keys_by_run_id, "step_keys_by_run_id", key_type=str)
+        if not step_keys_by_run_id:
+            return {}
+
+        # Fetch the step events for all of the runs in a single query against the index shard,
+        # restricting by step key only if every run specifies its step keys. Any finer-grained
+        # per-run step key filtering is applied below.
+        raw_event_query = self._step_stats_events_query(
+            [SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event]
+        ).where(SqlEventLogStorageTable.c.run_id.in_(list(step_keys_by_run_id.keys())))
+        if all(step_keys_by_run_id.values()):
+            all_step_keys = {
+                step_key
+                for step_keys in step_keys_by_run_id.values()
+                for step_key in check.not_none(step_keys)
+            }
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(list(all_step_keys))
+            )
+
+        with self.index_connection() as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        records_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for run_id, json_str in results:
+            try:
+                record = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+            step_keys = step_keys_by_run_id[run_id]
+            if step_keys and record.get_dagster_event().step_key not in step_keys:
+                continue
+            records_by_run_id[run_id].append(record)
+
+        return {
+            run_id: build_run_step_stats_from_events(run_id, records_by_run_id[run_id])
+            for run_id in step_keys_by_run_id
+        }
+
+    def _step_stats_events_query(self, columns):
+        return (
+            db.select(columns)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.STEP_START.value,
+                        DagsterEventType.STEP_SUCCESS.value,
+                        DagsterEventType.STEP_SKIPPED.value,
+                        DagsterEventType.STEP_FAILURE.value,
+                        DagsterEventType.STEP_RESTARTED.value,
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                        DagsterEventType.STEP_RESTARTED.value,
+                        DagsterEventType.STEP_UP_FOR_RETRY.value,
+                        DagsterEventType.ENGINE_EVENT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
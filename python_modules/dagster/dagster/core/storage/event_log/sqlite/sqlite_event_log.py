@@ -6,7 +6,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Mapping, Optional
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
@@ -19,7 +19,13 @@
 from dagster.config.source import StringSource
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster.core.execution.stats import RunStepKeyStatsSnapshot
+from dagster.core.storage.event_log.base import (
+    EventLogCursor,
+    EventLogRecord,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster.core.storage.sql import (
     check_alembic_revision,
@@ -345,6 +351,17 @@ def get_event_records(
 
         return event_records[:limit]
 
+    def get_step_stats_for_runs(
+        self, step_keys_by_run_id: Mapping[str, Optional[List[str]]]
+    ) -> Dict[str, List[RunStepKeyStatsSnapshot]]:
+        """Overridden method to fetch step stats shard by shard, using the per-run fallback from
+        EventLogStorage rather than the single index query from SqlEventLogStorage.
+
+        Step events are not mirrored into the index shard, so they cannot be fetched for multiple
+        runs in a single query.
+        """
+        return EventLogStorage.get_step_stats_for_runs(self, step_keys_by_run_id)
+
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
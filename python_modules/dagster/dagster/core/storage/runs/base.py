@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -98,6 +98,35 @@ def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun
                 descendent runs. Otherwise `None`.
         """
 
+    def get_run_group_records(self, run_id: str) -> Optional[Tuple[str, List[RunRecord]]]:
+        """Get the run group to which a given run belongs, as run records.
+
+        Storages that can fetch the run group and its records in a single query should override
+        this.
+
+        Args:
+            run_id (str): The id of a run in the group. See :py:meth:`get_run_group`.
+
+        Returns:
+            Optional[Tuple[string, List[RunRecord]]]: If there is a corresponding run group, tuple
+                whose first element is the root_run_id and whose second element is a list of the
+                run records for the root run and all of its descendant runs. Otherwise `None`.
+        """
+        run_group = self.get_run_group(run_id)
+        if run_group is None:
+            return None
+
+        root_run_id, runs = run_group
+        run_ids = [run.run_id for run in runs]
+        records_by_run_id = {
+            record.pipeline_run.run_id: record
+            for record in self.get_run_records(RunsFilter(run_ids=run_ids))
+        }
+        return (
+            root_run_id,
+            [records_by_run_id[run_id_] for run_id_ in run_ids if run_id_ in records_by_run_id],
+        )
+
     @abstractmethod
     def get_run_groups(
         self,
@@ -311,6 +340,26 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        """Fetch a batch of execution plan snapshots by ID
+
+        Storages that can fetch many snapshots in a single query should override this.
+
+        Args:
+            execution_plan_snapshot_ids (Sequence[str])
+
+        Returns:
+            Dict[str, ExecutionPlanSnapshot]: The fetched snapshots, keyed by snapshot id. Ids that
+                do not correspond to a stored snapshot are omitted.
+        """
+        return {
+            snapshot_id: self.get_execution_plan_snapshot(snapshot_id)
+            for snapshot_id in dict.fromkeys(execution_plan_snapshot_ids)
+            if self.has_execution_plan_snapshot(snapshot_id)
+        }
+
     @abstractmethod
     def wipe(self):
         """Clears the run storage."""
@@ -1,5 +1,5 @@
 from collections import OrderedDict, defaultdict
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import dagster._check as check
 from dagster.core.errors import (
@@ -276,6 +276,18 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._ep_snapshots[execution_plan_snapshot_id]
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        check.sequence_param(
+            execution_plan_snapshot_ids, "execution_plan_snapshot_ids", of_type=str
+        )
+        return {
+            snapshot_id: self._ep_snapshots[snapshot_id]
+            for snapshot_id in execution_plan_snapshot_ids
+            if snapshot_id in self._ep_snapshots
+        }
+
     def wipe(self):
         self._init_storage()
 
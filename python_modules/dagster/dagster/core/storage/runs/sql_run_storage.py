@@ -5,7 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
@@ -418,15 +418,11 @@ def get_run_records(
         filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
         check.opt_int_param(limit, "limit")
 
-        columns = ["id", "run_body", "create_timestamp", "update_timestamp"]
-
-        if self.has_run_stats_index_cols():
-            columns += ["start_time", "end_time"]
         # only fetch columns we use to build RunRecord
         query = self._runs_query(
             filters=filters,
             limit=limit,
-            columns=columns,
+            columns=self._run_record_columns(),
             order_by=order_by,
             ascending=ascending,
             cursor=cursor,
@@ -434,6 +430,15 @@ def get_run_records(
         )
 
         rows = self.fetchall(query)
+        return self._rows_to_run_records(rows)
+
+    def _run_record_columns(self) -> List[str]:
+        columns = ["id", "run_body", "create_timestamp", "update_timestamp"]
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        return columns
+
+    def _rows_to_run_records(self, rows) -> List[RunRecord]:
         return [
             RunRecord(
                 storage_id=check.int_param(row["id"], "id"),
@@ -556,6 +561,62 @@ def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun
 
         return (root_run_id, [root_run] + run_group)
 
+    def get_run_group_records(self, run_id: str) -> Optional[Tuple[str, List[RunRecord]]]:
+        check.str_param(run_id, "run_id")
+
+        # Fetches the run group in two statements whose filters are all equality lookups on indexed
+        # columns, rather than a single statement that ORs together IN subqueries (which postgres
+        # and mysql evaluate per row, scanning the runs table).
+        #
+        # pseudosql:
+        #
+        #   select * from runs where run_id = @run_id
+        #
+        #   select * from runs where run_id = @root_run_id
+        #   union all
+        #   select runs.* from runs join run_tags on runs.run_id = run_tags.run_id
+        #   where run_tags.key = @ROOT_RUN_ID_TAG and run_tags.value = @root_run_id
+
+        columns = [getattr(RunsTable.c, column) for column in self._run_record_columns()]
+        run_records = self._rows_to_run_records(
+            self.fetchall(db.select(columns).where(RunsTable.c.run_id == run_id))
+        )
+        if not run_records:
+            raise DagsterRunNotFoundError(
+                f"Run {run_id} was not found in instance.", invalid_run_id=run_id
+            )
+
+        pipeline_run = run_records[0].pipeline_run
+        root_run_id = pipeline_run.root_run_id if pipeline_run.root_run_id else pipeline_run.run_id
+
+        root_query = db.select(columns).where(RunsTable.c.run_id == root_run_id)
+        descendants_query = (
+            db.select(columns)
+            .select_from(RunsTable.join(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id))
+            .where(
+                db.and_(RunTagsTable.c.key == ROOT_RUN_ID_TAG, RunTagsTable.c.value == root_run_id)
+            )
+        )
+        records_by_run_id = {
+            record.pipeline_run.run_id: record
+            for record in sorted(
+                self._rows_to_run_records(
+                    self.fetchall(db.union_all(root_query, descendants_query))
+                ),
+                key=lambda record: record.storage_id,
+            )
+        }
+
+        root_record = records_by_run_id.pop(root_run_id, None)
+        if not root_record:
+            raise DagsterRunNotFoundError(
+                f"Run id {root_run_id} set as root run id for run {run_id} was not found in "
+                "instance.",
+                invalid_run_id=root_run_id,
+            )
+
+        return (root_run_id, [root_record] + list(records_by_run_id.values()))
+
     def get_run_groups(
         self,
         filters: Optional[RunsFilter] = None,
@@ -754,6 +815,27 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        check.sequence_param(
+            execution_plan_snapshot_ids, "execution_plan_snapshot_ids", of_type=str
+        )
+        if not execution_plan_snapshot_ids:
+            return {}
+
+        query = db.select([SnapshotsTable.c.snapshot_body, SnapshotsTable.c.snapshot_id]).where(
+            SnapshotsTable.c.snapshot_id.in_(list(execution_plan_snapshot_ids))
+        )
+        rows = self.fetchall(query)
+
+        snapshots_by_id = {}
+        for row in rows:
+            snapshot = defensively_unpack_pipeline_snapshot_query(logging, row)
+            if snapshot:
+                snapshots_by_id[row[1]] = snapshot
+        return snapshots_by_id
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -563,6 +563,34 @@ def test_event_log_step_stats(self, test_run_id, storage):
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_event_log_step_stats_for_runs(self, storage):
+        run_id_1 = make_new_run_id()
+        run_id_2 = make_new_run_id()
+        run_id_3 = make_new_run_id()
+
+        for record in _stats_records(run_id=run_id_1) + _stats_records(run_id=run_id_2):
+            storage.store_event(record)
+
+        step_stats_by_run_id = storage.get_step_stats_for_runs(
+            {run_id_1: None, run_id_2: ["A", "B"], run_id_3: None}
+        )
+        assert set(step_stats_by_run_id.keys()) == {run_id_1, run_id_2, run_id_3}
+
+        assert {stats.step_key for stats in step_stats_by_run_id[run_id_1]} == {
+            "A",
+            "B",
+            "C",
+            "D",
+        }
+        assert {stats.step_key for stats in step_stats_by_run_id[run_id_2]} == {"A", "B"}
+        assert step_stats_by_run_id[run_id_3] == []
+
+        b_stats = [stats for stats in step_stats_by_run_id[run_id_2] if stats.step_key == "B"][0]
+        assert b_stats.status.value == "FAILURE"
+        assert b_stats.end_time - b_stats.start_time == 50
+
+        assert storage.get_step_stats_for_runs({}) == {}
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
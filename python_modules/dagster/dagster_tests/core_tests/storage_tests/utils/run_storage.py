@@ -32,6 +32,7 @@
     TagBucket,
 )
 from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs.base import RunStorage
 from dagster.core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
 from dagster.core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster.core.storage.tags import (
@@ -860,6 +861,40 @@ def test_add_get_execution_snapshot(self, storage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_add_get_execution_snapshots(self, storage):
+        from dagster.core.execution.api import create_execution_plan
+        from dagster.core.snap import snapshot_from_execution_plan
+
+        @op
+        def op_one():
+            pass
+
+        pipeline_def_a = PipelineDefinition(name="some_pipeline", solid_defs=[])
+        pipeline_def_b = PipelineDefinition(name="some_other_pipeline", solid_defs=[op_one])
+        ep_snapshot_a = snapshot_from_execution_plan(
+            create_execution_plan(pipeline_def_a), pipeline_def_a.get_pipeline_snapshot_id()
+        )
+        ep_snapshot_b = snapshot_from_execution_plan(
+            create_execution_plan(pipeline_def_b), pipeline_def_b.get_pipeline_snapshot_id()
+        )
+
+        snapshot_id_a = storage.add_execution_plan_snapshot(ep_snapshot_a)
+        snapshot_id_b = storage.add_execution_plan_snapshot(ep_snapshot_b)
+
+        fetched = storage.get_execution_plan_snapshots([snapshot_id_a, snapshot_id_b, "nope"])
+        assert set(fetched.keys()) == {snapshot_id_a, snapshot_id_b}
+        assert serialize_pp(fetched[snapshot_id_a]) == serialize_pp(ep_snapshot_a)
+        assert serialize_pp(fetched[snapshot_id_b]) == serialize_pp(ep_snapshot_b)
+
+        assert storage.get_execution_plan_snapshots([]) == {}
+
+        # the per-snapshot fallback on the base class agrees with the storage's batch fetch
+        fallback = RunStorage.get_execution_plan_snapshots(
+            storage, [snapshot_id_a, snapshot_id_b, "nope"]
+        )
+        assert set(fallback.keys()) == {snapshot_id_a, snapshot_id_b}
+        assert serialize_pp(fallback[snapshot_id_b]) == serialize_pp(ep_snapshot_b)
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -940,6 +975,14 @@ def test_fetch_run_group(self, storage):
         assert run_group_one[0] == run_group_two[0]
         assert run_group_one[1] == run_group_two[1]
 
+        for run_id in [root_run.run_id, runs[2].run_id, runs[-1].run_id]:
+            _root_run_id, run_group_records = storage.get_run_group_records(run_id)
+            assert len(run_group_records) == 7
+            assert run_group_records[0].pipeline_run.run_id == root_run.run_id
+            assert {record.pipeline_run.run_id for record in run_group_records} == {
+                run.run_id for run in runs
+            }
+
     def test_fetch_run_group_not_found(self, storage):
         assert storage
         run = TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name="foo_pipeline")
@@ -948,6 +991,9 @@ def test_fetch_run_group_not_found(self, storage):
         with pytest.raises(DagsterRunNotFoundError):
             storage.get_run_group(make_new_run_id())
 
+        with pytest.raises(DagsterRunNotFoundError):
+            storage.get_run_group_records(make_new_run_id())
+
     def test_fetch_run_groups(self, storage):
         assert storage
         root_runs = [